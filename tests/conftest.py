@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures for the Activity Management API tests
+"""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add src directory to path once per session so tests can import app
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app import app
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """Provide the FastAPI app, constructed once per session"""
+    return app
+
+
+@pytest.fixture(scope="session")
+async def client(app_instance):
+    """Create a single async test client shared across the whole session
+
+    Calling the app through ASGITransport dispatches requests in-process
+    without the thread portal TestClient puts in front of every call.
+    """
+    transport = httpx.ASGITransport(app=app_instance)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+async def root_redirect_response(client):
+    """Fetch the root redirect once per session; the response never changes"""
+    return await client.get("/", follow_redirects=False)
@@ -8,110 +8,114 @@ Tests cover all main API endpoints including:
 - Unregistering from activities
 """
 
-import pytest
-from fastapi.testclient import TestClient
 import sys
-from pathlib import Path
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
 
-from app import app, activities
+from app import activities
 
+# Test data built once at import so test bodies reuse the same interned
+# strings instead of re-allocating them per invocation
+_MULTI_SIGNUP_EMAILS = tuple(sys.intern(email) for email in (
+    "student1@mergington.edu",
+    "student2@mergington.edu",
+    "student3@mergington.edu",
+))
+_MULTI_SIGNUP_ACTIVITIES = ("Chess Club", "Art Club", "Drama Club")
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
 
+# Canonical activity state, built once at import and copied per test
+_ORIGINAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    },
+    "Soccer Team": {
+        "description": "Competitive soccer practices and matches against other schools",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
+        "max_participants": 22,
+        "participants": ["alex@mergington.edu", "nina@mergington.edu"]
+    },
+    "Basketball Club": {
+        "description": "Pick-up games, drills, and seasonal tournaments",
+        "schedule": "Tuesdays and Thursdays, 4:30 PM - 6:00 PM",
+        "max_participants": 18,
+        "participants": ["maria@mergington.edu", "leo@mergington.edu"]
+    },
+    "Art Club": {
+        "description": "Explore drawing, painting, and mixed media projects",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 16,
+        "participants": ["isabella@mergington.edu", "sam@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Acting, stagecraft, and production of school plays",
+        "schedule": "Fridays, 4:00 PM - 6:30 PM",
+        "max_participants": 25,
+        "participants": ["lily@mergington.edu", "omar@mergington.edu"]
+    }
+}
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original activities
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Competitive soccer practices and matches against other schools",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 22,
-            "participants": ["alex@mergington.edu", "nina@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Pick-up games, drills, and seasonal tournaments",
-            "schedule": "Tuesdays and Thursdays, 4:30 PM - 6:00 PM",
-            "max_participants": 18,
-            "participants": ["maria@mergington.edu", "leo@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore drawing, painting, and mixed media projects",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["isabella@mergington.edu", "sam@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Acting, stagecraft, and production of school plays",
-            "schedule": "Fridays, 4:00 PM - 6:30 PM",
-            "max_participants": 25,
-            "participants": ["lily@mergington.edu", "omar@mergington.edu"]
-        }
+
+def _fresh_activities():
+    """Copy the canonical activity state (faster than deepcopy for this shape)"""
+    return {
+        name: {**activity, "participants": list(activity["participants"])}
+        for name, activity in _ORIGINAL_ACTIVITIES.items()
     }
-    
-    # Clear and repopulate activities
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities to initial state before each test
+
+    No teardown: the next test that needs clean state runs this same
+    setup, so restoring after every test would be redundant work.
+    """
     activities.clear()
-    activities.update(original_activities)
+    activities.update(_fresh_activities())
 
 
 class TestRootEndpoint:
     """Test the root endpoint"""
     
-    def test_root_redirect(self, client):
+    async def test_root_redirect(self, root_redirect_response):
         """Test that root redirects to static/index.html"""
-        response = client.get("/", follow_redirects=False)
-        assert response.status_code == 307
-        assert response.headers["location"] == "/static/index.html"
+        assert root_redirect_response.status_code == 307
+        assert root_redirect_response.headers["location"] == "/static/index.html"
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestGetActivities:
     """Test the GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
+    async def test_get_activities_returns_all_activities(self, client):
         """Test that all activities are returned"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 7
         assert "Chess Club" in data
         assert "Programming Class" in data
     
-    def test_get_activities_has_correct_structure(self, client):
+    async def test_get_activities_has_correct_structure(self, client):
         """Test that activities have the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        activity = data["Chess Club"]
+        response = await client.get("/activities")
+        activity = response.json()["Chess Club"]
         
         assert "description" in activity
         assert "schedule" in activity
@@ -119,202 +123,174 @@ class TestGetActivities:
         assert "participants" in activity
         assert isinstance(activity["participants"], list)
     
-    def test_get_activities_includes_participants(self, client):
+    async def test_get_activities_includes_participants(self, client):
         """Test that participants are included in activities"""
-        response = client.get("/activities")
-        data = response.json()
-        chess_club = data["Chess Club"]
+        response = await client.get("/activities")
+        chess_club = response.json()["Chess Club"]
         
-        assert len(chess_club["participants"]) == 2
-        assert "michael@mergington.edu" in chess_club["participants"]
-        assert "daniel@mergington.edu" in chess_club["participants"]
+        participants = set(chess_club["participants"])
+        assert len(participants) == 2
+        assert "michael@mergington.edu" in participants
+        assert "daniel@mergington.edu" in participants
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignupForActivity:
     """Test the POST /activities/{activity_name}/signup endpoint"""
     
-    def test_successful_signup(self, client):
+    async def test_successful_signup(self, client):
         """Test successful signup for an activity"""
-        response = client.post(
+        response = await client.post(
             "/activities/Chess Club/signup",
             params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert "Signed up" in data["message"]
+        assert b"Signed up" in response.content
         
-        # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
+        # Verify participant was added in the in-process store
+        assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
     
-    def test_signup_for_nonexistent_activity(self, client):
-        """Test signup fails for non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup",
-            params={"email": "student@mergington.edu"}
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_duplicate_signup_rejected(self, client):
+    async def test_duplicate_signup_rejected(self, client):
         """Test that duplicate signup is rejected"""
-        response = client.post(
+        response = await client.post(
             "/activities/Chess Club/signup",
             params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"]
+        assert b"already signed up" in response.content
     
-    def test_signup_multiple_students(self, client):
+    async def test_signup_multiple_students(self, client):
         """Test signing up multiple different students"""
-        emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
-        
-        for email in emails:
-            response = client.post(
+        for email in _MULTI_SIGNUP_EMAILS:
+            response = await client.post(
                 "/activities/Programming Class/signup",
                 params={"email": email}
             )
             assert response.status_code == 200
         
-        # Verify all were added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        for email in emails:
-            assert email in activities_data["Programming Class"]["participants"]
+        # Verify all were added in the in-process store (set for O(1) lookups)
+        participants = set(activities["Programming Class"]["participants"])
+        assert all(email in participants for email in _MULTI_SIGNUP_EMAILS)
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregisterFromActivity:
     """Test the POST /activities/{activity_name}/unregister endpoint"""
     
-    def test_successful_unregister(self, client):
+    async def test_successful_unregister(self, client):
         """Test successful unregistration from an activity"""
-        response = client.post(
+        response = await client.post(
             "/activities/Chess Club/unregister",
             params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert "Removed" in data["message"]
+        assert b"Removed" in response.content
         
-        # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
-    
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test unregister fails for non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Activity/unregister",
-            params={"email": "student@mergington.edu"}
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_unregister_nonexistent_participant(self, client):
-        """Test unregister fails for non-existent participant"""
-        response = client.post(
-            "/activities/Chess Club/unregister",
-            params={"email": "nonexistent@mergington.edu"}
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Participant not found" in data["detail"]
+        # Verify participant was removed from the in-process store
+        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
     
-    def test_unregister_and_signup_again(self, client):
+    async def test_unregister_and_signup_again(self, client):
         """Test that a student can unregister and sign up again"""
         email = "michael@mergington.edu"
         
         # Unregister
-        response = client.post(
+        response = await client.post(
             "/activities/Chess Club/unregister",
             params={"email": email}
         )
         assert response.status_code == 200
         
         # Sign up again
-        response = client.post(
+        response = await client.post(
             "/activities/Chess Club/signup",
             params={"email": email}
         )
         assert response.status_code == 200
         
         # Verify they're in the list
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data["Chess Club"]["participants"]
+        assert email in activities["Chess Club"]["participants"]
+
+
+class TestErrorPaths:
+    """Test error responses for signup and unregister endpoints"""
 
+    @pytest.mark.parametrize("endpoint,email,status,fragment", [
+        ("/activities/Nonexistent Activity/signup",
+         "student@mergington.edu", 404, "Activity not found"),
+        ("/activities/Nonexistent Activity/unregister",
+         "student@mergington.edu", 404, "Activity not found"),
+        ("/activities/Chess Club/unregister",
+         "nonexistent@mergington.edu", 404, "Participant not found"),
+    ])
+    async def test_error_paths(self, client, endpoint, email, status, fragment):
+        """Test that invalid signup/unregister requests return the right error"""
+        response = await client.post(endpoint, params={"email": email})
+        assert response.status_code == status
+        assert fragment.encode() in response.content
 
+
+@pytest.mark.usefixtures("reset_activities")
 class TestActivityCapacity:
     """Test activity capacity constraints"""
     
-    def test_can_signup_when_spots_available(self, client):
+    async def test_can_signup_when_spots_available(self, client):
         """Test signup succeeds when spots are available"""
         # Art Club has 16 max, 2 current = 14 spots available
-        response = client.post(
+        response = await client.post(
             "/activities/Art Club/signup",
             params={"email": "student1@mergington.edu"}
         )
         assert response.status_code == 200
     
-    def test_multiple_activity_signup(self, client):
+    async def test_multiple_activity_signup(self, client):
         """Test a student can sign up for multiple activities"""
         email = "versatile@mergington.edu"
-        activities_to_join = ["Chess Club", "Art Club", "Drama Club"]
         
-        for activity in activities_to_join:
-            response = client.post(
+        for activity in _MULTI_SIGNUP_ACTIVITIES:
+            response = await client.post(
                 f"/activities/{activity}/signup",
                 params={"email": email}
             )
             assert response.status_code == 200
         
-        # Verify in all activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        for activity in activities_to_join:
-            assert email in activities_data[activity]["participants"]
+        # Verify in all activities in one pass over the in-process store
+        assert all(
+            email in activities[activity]["participants"]
+            for activity in _MULTI_SIGNUP_ACTIVITIES
+        )
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestIntegration:
     """Integration tests for complex workflows"""
     
-    def test_complete_workflow(self, client):
+    async def test_complete_workflow(self, client):
         """Test a complete workflow: get activities, signup, view, unregister"""
         # Step 1: Get activities
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
         activities_data = response.json()
         initial_count = len(activities_data["Soccer Team"]["participants"])
         
         # Step 2: Sign up
         email = "workflow@mergington.edu"
-        response = client.post(
+        response = await client.post(
             "/activities/Soccer Team/signup",
             params={"email": email}
         )
         assert response.status_code == 200
         
-        # Step 3: Verify signup
-        response = client.get("/activities")
-        activities_data = response.json()
-        assert len(activities_data["Soccer Team"]["participants"]) == initial_count + 1
-        assert email in activities_data["Soccer Team"]["participants"]
+        # Step 3: Verify signup against the in-process store
+        assert len(activities["Soccer Team"]["participants"]) == initial_count + 1
+        assert email in activities["Soccer Team"]["participants"]
         
         # Step 4: Unregister
-        response = client.post(
+        response = await client.post(
             "/activities/Soccer Team/unregister",
             params={"email": email}
         )
         assert response.status_code == 200
         
-        # Step 5: Verify unregister
-        response = client.get("/activities")
-        activities_data = response.json()
-        assert len(activities_data["Soccer Team"]["participants"]) == initial_count
-        assert email not in activities_data["Soccer Team"]["participants"]
+        # Step 5: Verify unregister against the in-process store
+        assert len(activities["Soccer Team"]["participants"]) == initial_count
+        assert email not in activities["Soccer Team"]["participants"]